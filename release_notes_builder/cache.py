@@ -0,0 +1,59 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Optional
+import json
+import logging
+import os
+import tempfile
+import time
+
+
+log = logging.getLogger(__name__)
+
+# Override the cache location, or set to "off" to disable on-disk caching entirely
+CACHE_DIR_ENV = "RLSNOTES_CACHE_DIR"
+DEFAULT_CACHE_DIR = "~/.cache/rlsnotes"
+
+
+def cache_root() -> Optional[Path]:
+    raw = os.getenv(CACHE_DIR_ENV, DEFAULT_CACHE_DIR).strip()
+    if raw.lower() in ("", "0", "off", "none"):
+        return None
+    return Path(raw).expanduser()
+
+
+def cache_path(namespace: str, key: str) -> Optional[Path]:
+    root = cache_root()
+    if root is None:
+        return None
+    return root / namespace / f"{key}.json"
+
+
+def read_json(path: Optional[Path], max_age: Optional[float] = None) -> Optional[Any]:
+    # max_age (seconds) treats older entries as missing
+    if path is None:
+        return None
+    try:
+        if max_age is not None and time.time() - path.stat().st_mtime > max_age:
+            return None
+        with path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        log.debug("Ignoring unreadable cache entry %s: %s", path, e)
+        return None
+
+
+def write_json(path: Optional[Path], data: Any) -> None:
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename so concurrent readers never see a partial entry
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, path)
+    except OSError as e:
+        log.warning("Failed to write cache entry %s: %s", path, e)
@@ -1,16 +1,17 @@
 from __future__ import annotations
 import argparse
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
 import sys
 import logging
 from collections import Counter
+import asyncio
 
-from .config import load_config, Config, RepoSpec
-from .github_fetcher import GitHubFetcher
-from .preclass import classify, summarize_for_llm
-from .llm_consolidator import consolidate_openai
+from .config import load_config, RepoSpec
+from .github_fetcher import AsyncGitHubFetcher, PR
+from .preclass import classify, split_trivial, summarize_chores, summarize_for_llm
+from .llm_consolidator import consolidate_openai, consolidate_openai_chunks
 from .renderer import render_md
-from .shortcut_fetcher import ShortcutFetcher
+from .shortcut_fetcher import AsyncShortcutFetcher
 
 
 log = logging.getLogger(__name__)
@@ -35,6 +36,17 @@ def parse_args() -> argparse.Namespace:
         choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
         help="Logging level",
     )
+    p.add_argument(
+        "--max-concurrent-repos",
+        type=int,
+        default=4,
+        help="Maximum number of repositories fetched from GitHub in parallel",
+    )
+    p.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached LLM output and call the model again (the fresh result is still cached)",
+    )
     return p.parse_args()
 
 
@@ -48,9 +60,75 @@ def _apply_overrides_to_repo(r: RepoSpec, since_ref: Optional[str], until_ref: O
     return r
 
 
+async def _enrich_with_shortcut(sc: AsyncShortcutFetcher, prs: List[PR]) -> None:
+    story_ids = [(p, sc.extract_story_id(p.title, p.body_excerpt)) for p in prs]
+    # Several PRs often reference the same story; resolve the unique ids in batches
+    stories = await sc.get_stories(sid for _, sid in story_ids if sid)
+    for p, sid in story_ids:
+        story = stories.get(sid) if sid else None
+        if story:
+            p.shortcut_id = story.id
+            p.shortcut_name = story.name
+            p.shortcut_url = story.app_url
+            p.shortcut_description = story.description
+
+
+# (LLM snapshot, verbatim chores, contributor handles) for one repo
+RepoSummary = Tuple[Dict, List[Dict], List[str]]
+
+
+def _summarize_repo(r: RepoSpec, prs: List[PR]) -> RepoSummary:
+    classified = [classify(p) for p in prs]
+    # quick category counts (debug only; skip the extra pass otherwise)
+    if log.isEnabledFor(logging.DEBUG):
+        counts = Counter(c.category for c in classified)
+        log.debug("Category counts for %s: %s", r.full_name, dict(counts))
+    # Dependency bumps and CI/build chores don't need LLM reasoning; list them verbatim instead
+    needs_llm, trivial = split_trivial(classified)
+    log.debug("%s: %d PRs for the LLM, %d trivial", r.full_name, len(needs_llm), len(trivial))
+    snap = {"repo": r.full_name, "prs": summarize_for_llm(needs_llm)}
+    return snap, summarize_chores(r.full_name, trivial), [f"@{p.author}" for p in prs if p.author]
+
+
+async def _fetch_all(
+    token: str,
+    shortcut_token: Optional[str],
+    repos: List[RepoSpec],
+    until_ref: Optional[str],
+    since_date: Optional[str],
+    max_concurrent: int,
+) -> List[RepoSummary]:
+    sem = asyncio.Semaphore(max(1, max_concurrent))
+    # One Shortcut client for all repos: its story memo means a story shared across repos is fetched once
+    async with AsyncGitHubFetcher(token) as gh, AsyncShortcutFetcher(shortcut_token) as sc:
+
+        async def fetch_one(r: RepoSpec) -> RepoSummary:
+            async with sem:
+                log.info("Fetching PRs for %s (since_ref=%s, until_ref=%s, since_date=%s)", r.full_name, r.since_ref, r.until_ref or until_ref, r.since_date or since_date)
+                prs = await gh.fetch_prs(
+                    r.owner,
+                    r.name,
+                    r.since_ref,
+                    r.until_ref or until_ref or "HEAD",
+                    r.since_date or since_date,
+                )
+                log.info("Fetched %d merged PRs for %s", len(prs), r.full_name)
+            # Enrich outside the semaphore so this repo's story lookups overlap other repos' PR fetches
+            if sc.enabled:
+                await _enrich_with_shortcut(sc, prs)
+            # Reduce to the compact snapshot now so this repo's PR objects can be freed
+            return _summarize_repo(r, prs)
+
+        # gather() returns results in repo order regardless of completion order
+        return list(await asyncio.gather(*(fetch_one(r) for r in repos)))
+
+
 def main() -> int:
     args = parse_args()
     logging.basicConfig(level=getattr(logging, args.log_level), format="%(levelname)s %(name)s: %(message)s")
+    # httpx logs every request at INFO; only surface that when debugging
+    if args.log_level != "DEBUG":
+        logging.getLogger("httpx").setLevel(logging.WARNING)
     log.info("Starting Release Notes Builder")
     cfg = load_config(args.config)
     log.debug("Loaded config from %s", args.config or "(defaults)")
@@ -96,53 +174,37 @@ def main() -> int:
 
     snapshots: List[Dict] = []
     all_contributors: List[str] = []
+    chores: List[Dict] = []
 
     if args.llm_only:
         log.info("--llm-only mode: skipping GitHub fetching; using hardwired USER_MESSAGE in consolidator")
     else:
-        gh = GitHubFetcher(cfg.github.get_token())
-        sc = ShortcutFetcher(cfg.shortcut.get_token())
-
-        for r in repos:
-            log.info("Fetching PRs for %s (since_ref=%s, until_ref=%s, since_date=%s)", r.full_name, r.since_ref, r.until_ref or args.until_ref, r.since_date or args.since_date)
-            prs = gh.fetch_prs(
-                r.owner,
-                r.name,
-                r.since_ref,
-                r.until_ref or args.until_ref or "HEAD",
-                r.since_date or args.since_date,
+        summaries = asyncio.run(
+            _fetch_all(
+                cfg.github.get_token(),
+                cfg.shortcut.get_token(),
+                repos,
+                args.until_ref,
+                args.since_date,
+                args.max_concurrent_repos,
             )
-            log.info("Fetched %d merged PRs for %s", len(prs), r.full_name)
-            # Enrich with Shortcut if available
-            if sc.enabled:
-                for p in prs:
-                    sid = sc.extract_story_id(p.title, p.body_excerpt)
-                    if sid:
-                        story = sc.get_story(sid)
-                        if story:
-                            p.shortcut_id = story.id
-                            p.shortcut_name = story.name
-                            p.shortcut_url = story.app_url
-                            p.shortcut_description = story.description
-            classified = [classify(p) for p in prs]
-            # quick category counts
-            counts = Counter([c.category for c in classified])
-            log.debug("Category counts for %s: %s", r.full_name, dict(counts))
-            snap = {"repo": r.full_name, "prs": summarize_for_llm(classified)}
-            snapshots.append(snap)
-            all_contributors.extend([f"@{p.author}" for p in prs if p.author])
+        )
+        for snap, repo_chores, contributors in summaries:
+            # Repos left with only trivial PRs have nothing for the LLM to summarize
+            if snap["prs"]:
+                snapshots.append(snap)
+            chores.extend(repo_chores)
+            all_contributors.extend(contributors)
 
     # Determine display range for the consolidator header
-    def collect_field(field: str) -> Set[str]:
-        vals: Set[str] = set()
-        for r in repos:
-            v = getattr(r, field)
-            if v:
-                vals.add(v)
-        return vals
-
-    since_vals = collect_field("since_ref") if not args.llm_only else set()
-    until_vals = collect_field("until_ref") if not args.llm_only else set()
+    # (repos is empty in --llm-only mode)
+    since_vals: Set[str] = set()
+    until_vals: Set[str] = set()
+    for r in repos:
+        if r.since_ref:
+            since_vals.add(r.since_ref)
+        if r.until_ref:
+            until_vals.add(r.until_ref)
 
     if args.llm_only:
         since_display = "per-repo"
@@ -151,18 +213,42 @@ def main() -> int:
         since_display = next(iter(since_vals)) if len(since_vals) == 1 else ("per-repo" if since_vals else "auto")
         until_display = next(iter(until_vals)) if len(until_vals) == 1 else ("per-repo" if until_vals else (args.until_ref or "HEAD"))
 
-    log.info("Consolidating with model=%s; window: %s -> %s", cfg.llm.model, since_display, until_display)
-    llm_out = consolidate_openai(
-        snapshots,
-        since_display,
-        until_display,
-        cfg.llm.model,
-        cfg.llm.temperature,
-        api_key=cfg.llm.get_api_key(),
-        use_override=args.llm_only,
-    )
+    if not snapshots and not args.llm_only:
+        log.info("No PRs need LLM consolidation; skipping model call")
+        llm_out = {"tldr": [], "repos": [], "upgrade_notes": [], "contributors": []}
+    else:
+        log.info("Consolidating with model=%s; window: %s -> %s", cfg.llm.model, since_display, until_display)
+        if args.llm_only:
+            llm_out = consolidate_openai(
+                snapshots,
+                since_display,
+                until_display,
+                cfg.llm.model,
+                cfg.llm.temperature,
+                api_key=cfg.llm.get_api_key(),
+                use_override=True,
+                use_cache=not args.no_cache,
+                rpm=cfg.llm.rpm,
+                tpm=cfg.llm.tpm,
+                completion_tokens=cfg.llm.max_tokens,
+            )
+        else:
+            # One LLM call per repo (run concurrently), merged afterwards
+            llm_out = consolidate_openai_chunks(
+                snapshots,
+                since_display,
+                until_display,
+                cfg.llm.model,
+                cfg.llm.temperature,
+                api_key=cfg.llm.get_api_key(),
+                max_concurrency=cfg.llm.max_concurrency,
+                use_cache=not args.no_cache,
+                rpm=cfg.llm.rpm,
+                tpm=cfg.llm.tpm,
+                completion_tokens=cfg.llm.max_tokens,
+            )
 
-    llm_out_with_title = {**llm_out, "title": cfg.release.title}
+    llm_out_with_title = {**llm_out, "title": cfg.release.title, "chores": chores}
 
     md = render_md(llm_out_with_title)
 
@@ -4,11 +4,20 @@ import os
 import yaml
 from dotenv import load_dotenv
 
-# Load .env once at import time
-load_dotenv()
+_dotenv_loaded = False
 
 
-@dataclass
+def _load_dotenv_once() -> None:
+    # Deferred from import time; CI with a populated env can set RLSNOTES_SKIP_DOTENV=1 to skip the .env lookup
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    _dotenv_loaded = True
+    if os.getenv("RLSNOTES_SKIP_DOTENV") != "1":
+        load_dotenv()
+
+
+@dataclass(slots=True)
 class RepoSpec:
     owner: str
     name: str
@@ -21,13 +30,16 @@ class RepoSpec:
         return f"{self.owner}/{self.name}"
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMConfig:
     provider: str = "openai"
     model: str = "gpt-5"
     max_tokens: int = 2000
     temperature: float = 1
     api_key_env: str = "OPENAI_API_KEY"
+    max_concurrency: int = 4  # parallel per-repo consolidation requests
+    rpm: int = 500  # client-side request pacing; match your OpenAI rate limits
+    tpm: int = 200_000
 
     def get_api_key(self) -> str:
         api_key = os.getenv(self.api_key_env)
@@ -36,7 +48,7 @@ class LLMConfig:
         return api_key
 
 
-@dataclass
+@dataclass(slots=True)
 class GitHubConfig:
     token_env: str = "GITHUB_TOKEN"
 
@@ -47,7 +59,7 @@ class GitHubConfig:
         return token
 
 
-@dataclass
+@dataclass(slots=True)
 class ShortcutConfig:
     token_env: str = "SHORTCUT_TOKEN"
 
@@ -56,21 +68,21 @@ class ShortcutConfig:
         return os.getenv(self.token_env)
 
 
-@dataclass
+@dataclass(slots=True)
 class RenderConfig:
     outfile: str = "RELEASE_NOTES.md"
     sort_by_area: bool = True
     include_contributors: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class ReleaseConfig:
     title: str = "Release"
     since_ref: Optional[str] = None
     until_ref: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     release: ReleaseConfig = field(default_factory=ReleaseConfig)
     repos: List[RepoSpec] = field(default_factory=list)
@@ -81,6 +93,7 @@ class Config:
 
 
 def load_config(path: Optional[str]) -> Config:
+    _load_dotenv_once()
     if not path:
         return Config()
     with open(path, "r", encoding="utf-8") as f:
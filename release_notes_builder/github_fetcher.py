@@ -1,18 +1,58 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 from datetime import datetime
+import asyncio
+import hashlib
+import math
+import random
 import re
-import requests
+import sys
+import httpx
+import orjson
 import logging
 
-from .utils import make_gh_session
+from .cache import cache_path, read_json, write_json
+from .utils import GH_RETRY_STATUSES, chunk_lines, gh_headers, gh_rate_limit_wait
 
 
 log = logging.getLogger(__name__)
 
+GITHUB_API = "https://api.github.com"
+SEARCH_PAGE_SIZE = 100
+# The search API never returns more than this many results for a query
+SEARCH_RESULT_LIMIT = 1000
+GITHUB_GRAPHQL = f"{GITHUB_API}/graphql"
 
-@dataclass
+# One search call returns up to 100 fully-populated PRs, replacing a REST hydration per PR
+PR_SEARCH_GQL = """
+query($q: String!, $cursor: String) {
+  search(query: $q, type: ISSUE, first: 100, after: $cursor) {
+    pageInfo { endCursor hasNextPage }
+    nodes {
+      ... on PullRequest {
+        number
+        title
+        body
+        url
+        mergedAt
+        changedFiles
+        labels(first: 20) { nodes { name } }
+        author { login }
+        mergeCommit { oid }
+      }
+    }
+  }
+}
+"""
+
+
+class GraphQLError(RuntimeError):
+    pass
+
+
+@dataclass(slots=True)
 class PR:
     number: int
     title: str
@@ -28,159 +68,395 @@ class PR:
     shortcut_name: Optional[str] = None
     shortcut_url: Optional[str] = None
     shortcut_description: Optional[str] = None
+    # Label set for classification, computed once at construction
+    labels_norm: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # The single place labels are lowercased; interned because they repeat across hundreds of PRs
+        self.labels = [sys.intern(l.lower()) for l in self.labels or []]
+        self.labels_norm = frozenset(self.labels)
+
+
+def _repo_path(owner: str, name: str) -> str:
+    return f"/repos/{owner}/{name}"
+
+
+def _pick_prev_tag(owner: str, name: str, tags: List[Dict], until_ref: str) -> Optional[str]:
+    tag_names = [t["name"] for t in tags]
+    if until_ref in tag_names:
+        idx = tag_names.index(until_ref)
+        if idx + 1 < len(tag_names):
+            prev = tag_names[idx + 1]
+            log.info("Auto-detected previous tag for %s/%s: %s (until=%s)", owner, name, prev, until_ref)
+            return prev
+    if len(tag_names) > 1:
+        log.info("Auto-detected previous tag (fallback) for %s/%s: %s", owner, name, tag_names[1])
+        return tag_names[1]
+    log.warning("No previous tag found for %s/%s", owner, name)
+    return None
+
+
+def _date_range_from_compare(cmp: Dict) -> Optional[str]:
+    commits = cmp.get("commits") or []
+    if not commits:
+        return None
+    # GitHub returns UTC "YYYY-MM-DDTHH:MM:SSZ" timestamps, which sort lexically; no need to parse them
+    since = until = None
+    for c in commits:
+        d = c["commit"]["author"]["date"]
+        if since is None or d < since:
+            since = d
+        if until is None or d > until:
+            until = d
+    dr = f"{since[:10]}..{until[:10]}"
+    log.debug("Derived date range from compare: %s", dr)
+    return dr
+
+
+def _date_range_from_since_date(since_date: str) -> str:
+    # Use provided since_date up to today
+    date_range = f"{since_date}..{datetime.utcnow().strftime('%Y-%m-%d')}"
+    log.debug("Using user-provided date range: %s", date_range)
+    return date_range
+
+
+def _search_query(owner: str, name: str, date_range: Optional[str]) -> str:
+    q = f"repo:{owner}/{name} is:pr is:merged"
+    if date_range:
+        q += f" merged:{date_range}"
+    return q
+
+
+def _etag_cache_entry(namespace: str, key: str) -> Tuple[Optional[Path], Optional[Dict[str, Any]], Dict[str, str]]:
+    # Returns (cache path, cached entry, conditional request headers)
+    path = cache_path(namespace, key)
+    cached = read_json(path)
+    headers = {"If-None-Match": cached["etag"]} if cached and cached.get("etag") else {}
+    return path, cached, headers
+
+
+def _store_etag_entry(path: Optional[Path], etag: Optional[str], data: Any) -> None:
+    if etag:
+        write_json(path, {"etag": etag, "data": data})
+
+
+def _compare_cache_key(owner: str, name: str, base: str, head: str) -> str:
+    # Refs may contain slashes, so hash them into a flat file name
+    return f"{owner}/{name}/" + hashlib.sha256(f"{base}...{head}".encode("utf-8")).hexdigest()
+
+
+def _search_page_count(first_page: Dict[str, Any]) -> int:
+    total = min(first_page.get("total_count") or 0, SEARCH_RESULT_LIMIT)
+    return math.ceil(total / SEARCH_PAGE_SIZE)
+
+
+def _pr_from_json(number: int, p: Dict[str, Any]) -> PR:
+    labels = [l["name"] for l in (p.get("labels") or [])]
+    body_excerpt = chunk_lines(p.get("body") or "", max_lines=10)
+    # Logins repeat across hundreds of PRs; intern them so each distinct value is stored once
+    author = sys.intern((p.get("user") or {}).get("login") or "")
+    merge_sha = p.get("merge_commit_sha")
+    merged_at = p.get("merged_at")
+    changed_files = p.get("changed_files")
+    return PR(
+        number=number,
+        title=p.get("title") or "",
+        body_excerpt=body_excerpt,
+        labels=labels,
+        author=author,
+        url=p.get("html_url") or "",
+        merge_sha=merge_sha,
+        merged_at=merged_at,
+        changed_files=changed_files,
+    )
+
+
+def _pr_from_graphql(node: Dict[str, Any]) -> PR:
+    # Reshape into the REST payload so both paths share one parser
+    return _pr_from_json(node["number"], {
+        "title": node.get("title"),
+        "body": node.get("body"),
+        "labels": (node.get("labels") or {}).get("nodes"),
+        "user": node.get("author"),
+        "html_url": node.get("url"),
+        "merge_commit_sha": (node.get("mergeCommit") or {}).get("oid"),
+        "merged_at": node.get("mergedAt"),
+        "changed_files": node.get("changedFiles"),
+    })
+
+
+def _parse_graphql_search(data: Dict[str, Any]) -> Tuple[List[PR], Optional[str]]:
+    # Returns (prs on this page, cursor for the next page or None)
+    if data.get("errors"):
+        raise GraphQLError("; ".join(e.get("message", "") for e in data["errors"]))
+    search = data["data"]["search"]
+    # Non-PR search hits come back as empty objects
+    prs = [_pr_from_graphql(n) for n in search.get("nodes") or [] if n and n.get("number")]
+    info = search.get("pageInfo") or {}
+    return prs, info.get("endCursor") if info.get("hasNextPage") else None
 
 
 class GitHubFetcher:
+    """Blocking wrapper over AsyncGitHubFetcher, kept for callers without an event loop.
+
+    Each call runs on its own event loop and client; use AsyncGitHubFetcher directly for bulk work.
+    """
+
     def __init__(self, token: str):
-        self.s = make_gh_session(token)
+        self.token = token
+
+    def _run(self, method: str, *args: Any) -> Any:
+        async def call() -> Any:
+            async with AsyncGitHubFetcher(self.token) as gh:
+                return await getattr(gh, method)(*args)
 
-    def _repo(self, owner: str, name: str) -> str:
-        return f"/repos/{owner}/{name}"
+        return asyncio.run(call())
 
     def get_default_branch(self, owner: str, name: str) -> str:
+        return self._run("get_default_branch", owner, name)
+
+    def list_tags(self, owner: str, name: str, per_page: int = 100) -> List[Dict]:
+        return self._run("list_tags", owner, name, per_page)
+
+    def compare(self, owner: str, name: str, base: str, head: str) -> Dict:
+        return self._run("compare", owner, name, base, head)
+
+    def auto_prev_tag(self, owner: str, name: str, until_ref: str) -> Optional[str]:
+        return self._run("auto_prev_tag", owner, name, until_ref)
+
+    def date_range_from_compare(self, cmp: Dict) -> Optional[str]:
+        return _date_range_from_compare(cmp)
+
+    def fetch_prs(self, owner: str, name: str, since_ref: Optional[str], until_ref: str, since_date: Optional[str]) -> List[PR]:
+        return self._run("fetch_prs", owner, name, since_ref, until_ref, since_date)
+
+
+class AsyncGitHubFetcher:
+    """Fetches tags, compare ranges and merged PRs over a shared HTTP/2 httpx client.
+
+    Use as ``async with AsyncGitHubFetcher(token) as gh: ...`` so the client is closed.
+    """
+
+    MAX_RETRIES = 5
+    # Search pages fetched ahead of the page being hydrated
+    MAX_PAGES_IN_FLIGHT = 3
+
+    def __init__(self, token: str, max_connections: int = 20):
+        self.client = httpx.AsyncClient(
+            base_url=GITHUB_API,
+            headers=gh_headers(token),
+            http2=True,
+            limits=httpx.Limits(max_connections=max_connections),
+            timeout=30,
+        )
+        # HTTP/2 multiplexes streams over one connection, so bound in-flight requests explicitly
+        self._sem = asyncio.Semaphore(max_connections)
+
+    async def __aenter__(self) -> "AsyncGitHubFetcher":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        # Mirror make_gh_session's retry policy: jittered backoff on connection/read errors and
+        # GH_RETRY_STATUSES, honouring Retry-After
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                async with self._sem:
+                    r = await self.client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                if attempt == self.MAX_RETRIES:
+                    raise
+                delay = 0.5 * 2 ** attempt + random.uniform(0, 0.5)
+                log.debug("GitHub request %s %s failed (%s); retrying in %.1fs", method, url, e, delay)
+                await asyncio.sleep(delay)
+                continue
+            rate_limit_wait = gh_rate_limit_wait(r.status_code, r.headers)
+            if (r.status_code not in GH_RETRY_STATUSES and rate_limit_wait is None) or attempt == self.MAX_RETRIES:
+                return r
+            retry_after = r.headers.get("Retry-After")
+            if rate_limit_wait is not None:
+                delay = rate_limit_wait
+            elif retry_after and retry_after.isdigit():
+                delay = float(retry_after)
+            else:
+                delay = 0.5 * 2 ** attempt
+            delay += random.uniform(0, 0.5)
+            log.debug("GitHub returned %d for %s; retrying in %.1fs", r.status_code, url, delay)
+            await asyncio.sleep(delay)
+        return r
+
+    async def _get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        return await self._request("GET", url, params=params, headers=headers)
+
+    async def get_default_branch(self, owner: str, name: str) -> str:
         log.debug("Fetching default branch for %s/%s", owner, name)
-        r = self.s.get(f"https://api.github.com{self._repo(owner, name)}")
+        r = await self._get(_repo_path(owner, name))
         try:
             r.raise_for_status()
-        except requests.HTTPError:
+        except httpx.HTTPStatusError:
             log.error("Failed to get repo metadata: %s", r.text)
             raise
-        return r.json()["default_branch"]
+        return orjson.loads(r.content)["default_branch"]
 
-    def list_tags(self, owner: str, name: str, per_page: int = 100) -> List[Dict]:
+    async def list_tags(self, owner: str, name: str, per_page: int = 100) -> List[Dict]:
         log.debug("Listing tags for %s/%s", owner, name)
-        r = self.s.get(
-            f"https://api.github.com{self._repo(owner, name)}/tags",
-            params={"per_page": per_page},
-        )
+        path, cached, headers = _etag_cache_entry("tags", f"{owner}/{name}/{per_page}")
+        r = await self._get(f"{_repo_path(owner, name)}/tags", params={"per_page": per_page}, headers=headers)
+        if r.status_code == 304 and cached:
+            log.debug("Tags for %s/%s not modified; using cached copy", owner, name)
+            return cached["data"]
         try:
             r.raise_for_status()
-        except requests.HTTPError:
+        except httpx.HTTPStatusError:
             log.error("Failed to list tags: %s", r.text)
             raise
-        return r.json()
+        tags = orjson.loads(r.content)
+        _store_etag_entry(path, r.headers.get("ETag"), tags)
+        return tags
 
-    def compare(self, owner: str, name: str, base: str, head: str) -> Dict:
-        # base...head supports tags or shas
-        url = f"https://api.github.com{self._repo(owner, name)}/compare/{base}...{head}"
+    async def compare(self, owner: str, name: str, base: str, head: str) -> Dict:
+        url = f"{_repo_path(owner, name)}/compare/{base}...{head}"
         log.debug("Compare range %s..%s via %s", base, head, url)
-        r = self.s.get(url)
+        path, cached, headers = _etag_cache_entry("compare", _compare_cache_key(owner, name, base, head))
+        r = await self._get(url, headers=headers)
+        if r.status_code == 304 and cached:
+            log.debug("Compare %s..%s not modified; using cached copy", base, head)
+            return cached["data"]
         try:
             r.raise_for_status()
-        except requests.HTTPError:
+        except httpx.HTTPStatusError:
             log.error("Compare failed (%s..%s): %s", base, head, r.text)
             raise
-        return r.json()
+        cmp = orjson.loads(r.content)
+        _store_etag_entry(path, r.headers.get("ETag"), cmp)
+        return cmp
 
-    def auto_prev_tag(self, owner: str, name: str, until_ref: str) -> Optional[str]:
-        tags = self.list_tags(owner, name)
-        tag_names = [t["name"] for t in tags]
-        if until_ref in tag_names:
-            idx = tag_names.index(until_ref)
-            if idx + 1 < len(tag_names):
-                prev = tag_names[idx + 1]
-                log.info("Auto-detected previous tag for %s/%s: %s (until=%s)", owner, name, prev, until_ref)
-                return prev
-        if len(tag_names) > 1:
-            log.info("Auto-detected previous tag (fallback) for %s/%s: %s", owner, name, tag_names[1])
-            return tag_names[1]
-        log.warning("No previous tag found for %s/%s", owner, name)
-        return None
+    async def auto_prev_tag(self, owner: str, name: str, until_ref: str) -> Optional[str]:
+        return _pick_prev_tag(owner, name, await self.list_tags(owner, name), until_ref)
 
-    def date_range_from_compare(self, cmp: Dict) -> Optional[str]:
-        commits = cmp.get("commits") or []
-        if not commits:
-            return None
-        dates = [datetime.fromisoformat(c["commit"]["author"]["date"].replace("Z", "+00:00")) for c in commits]
-        since = min(dates).strftime("%Y-%m-%d")
-        until = max(dates).strftime("%Y-%m-%d")
-        dr = f"{since}..{until}"
-        log.debug("Derived date range from compare: %s", dr)
-        return dr
-
-    def fetch_prs(self, owner: str, name: str, since_ref: Optional[str], until_ref: str, since_date: Optional[str]) -> List[PR]:
+    async def fetch_prs(self, owner: str, name: str, since_ref: Optional[str], until_ref: str, since_date: Optional[str]) -> List[PR]:
         log.debug("fetch_prs(owner=%s, repo=%s, since_ref=%s, until_ref=%s, since_date=%s)", owner, name, since_ref, until_ref, since_date)
-        # If since_ref missing, try auto-detect previous tag on default branch
         if not since_ref:
-            prev = self.auto_prev_tag(owner, name, until_ref)
+            prev = await self.auto_prev_tag(owner, name, until_ref)
             if prev:
                 since_ref = prev
-        # Build a date window using compare if refs available
         date_range = None
         if since_ref and until_ref:
             try:
-                cmp = self.compare(owner, name, since_ref, until_ref)
-                date_range = self.date_range_from_compare(cmp)
-            except requests.HTTPError as e:
+                cmp = await self.compare(owner, name, since_ref, until_ref)
+                date_range = _date_range_from_compare(cmp)
+            except httpx.HTTPStatusError as e:
                 log.warning("Compare failed for %s/%s (%s..%s); will try since_date if provided. %s", owner, name, since_ref, until_ref, e)
                 date_range = None
         if not date_range and since_date:
-            # Use provided since_date up to today
-            date_range = f"{since_date}..{datetime.utcnow().strftime('%Y-%m-%d')}"
-            log.debug("Using user-provided date range: %s", date_range)
+            date_range = _date_range_from_since_date(since_date)
+
+        try:
+            prs = await self.fetch_prs_graphql(owner, name, date_range)
+        except (httpx.HTTPStatusError, httpx.TransportError, GraphQLError) as e:
+            log.warning("GraphQL search failed for %s/%s; falling back to REST search. %s", owner, name, e)
+            prs = await self._fetch_prs_rest(owner, name, date_range)
+        log.info("Total merged PRs fetched for %s/%s: %d", owner, name, len(prs))
+        return prs
 
-        # Search merged PRs by date range
+    async def fetch_prs_graphql(self, owner: str, name: str, date_range: Optional[str]) -> List[PR]:
         prs: List[PR] = []
+        cursor: Optional[str] = None
         page = 1
+        q = _search_query(owner, name, date_range)
         while True:
-            q = f"repo:{owner}/{name} is:pr is:merged"
-            if date_range:
-                q += f" merged:{date_range}"
-            log.debug("Search issues page %d query: %s", page, q)
-            r = self.s.get(
-                "https://api.github.com/search/issues",
-                params={"q": q, "per_page": 100, "page": page},
-            )
+            log.debug("GraphQL search page %d query: %s", page, q)
+            r = await self._request("POST", "/graphql", json={"query": PR_SEARCH_GQL, "variables": {"q": q, "cursor": cursor}})
             try:
                 r.raise_for_status()
-            except requests.HTTPError as e:
-                log.error("Search API error for %s/%s page %d: %s | body=%s", owner, name, page, e, r.text)
+            except httpx.HTTPStatusError:
+                log.error("GraphQL search failed for %s/%s page %d: %s", owner, name, page, r.text)
                 raise
-            data = r.json()
-            items = data.get("items", [])
-            if not items:
-                log.debug("No more items on page %d", page)
-                break
-            for it in items:
-                number = it["number"]
-                pr = self._hydrate_pr(owner, name, number)
-                if pr:
-                    prs.append(pr)
+            page_prs, cursor = _parse_graphql_search(orjson.loads(r.content))
+            prs.extend(page_prs)
             log.debug("Accumulated %d PRs after page %d", len(prs), page)
-            if len(items) < 100:
+            if not cursor:
                 break
             page += 1
-        log.info("Total merged PRs fetched for %s/%s: %d", owner, name, len(prs))
         return prs
 
-    def _hydrate_pr(self, owner: str, name: str, number: int) -> Optional[PR]:
-        url = f"https://api.github.com{self._repo(owner, name)}/pulls/{number}"
+    async def _search_page(self, owner: str, name: str, q: str, page: int) -> Dict[str, Any]:
+        log.debug("Search issues page %d query: %s", page, q)
+        r = await self._get("/search/issues", params={"q": q, "per_page": SEARCH_PAGE_SIZE, "page": page})
+        try:
+            r.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            log.error("Search API error for %s/%s page %d: %s | body=%s", owner, name, page, e, r.text)
+            raise
+        return orjson.loads(r.content)
+
+    async def _fetch_prs_rest(self, owner: str, name: str, date_range: Optional[str]) -> List[PR]:
+        prs: List[PR] = []
+        q = _search_query(owner, name, date_range)
+        first = await self._search_page(owner, name, q, 1)
+        pages = _search_page_count(first)
+        # Producer starts later page fetches (in order) while the consumer hydrates the current page,
+        # so search latency overlaps hydration. A slot is taken before each fetch starts and handed
+        # back once the consumer has the page, so at most MAX_PAGES_IN_FLIGHT pages are outstanding.
+        queue: asyncio.Queue = asyncio.Queue()
+        slots = asyncio.Semaphore(self.MAX_PAGES_IN_FLIGHT)
+
+        async def produce() -> None:
+            for page in range(2, pages + 1):
+                await slots.acquire()
+                queue.put_nowait(asyncio.create_task(self._search_page(owner, name, q, page)))
+            queue.put_nowait(None)
+
+        producer = asyncio.create_task(produce())
+        try:
+            data, page = first, 1
+            while True:
+                items = data.get("items", [])
+                if not items:
+                    log.debug("No more items on page %d", page)
+                    break
+                hydrated = await asyncio.gather(*(self._hydrate_pr(owner, name, it["number"]) for it in items))
+                prs.extend(pr for pr in hydrated if pr)
+                log.debug("Accumulated %d PRs after page %d/%d", len(prs), page, pages)
+                next_page = await queue.get()
+                if next_page is None:
+                    break
+                data, page = await next_page, page + 1
+                slots.release()
+        finally:
+            producer.cancel()
+            while not queue.empty():
+                pending = queue.get_nowait()
+                if pending is not None:
+                    pending.cancel()
+        return prs
+
+    async def _hydrate_pr(self, owner: str, name: str, number: int) -> Optional[PR]:
+        url = f"{_repo_path(owner, name)}/pulls/{number}"
         log.debug("Hydrating PR #%d via %s", number, url)
-        r = self.s.get(url)
+        path, cached, headers = _etag_cache_entry("prs", f"{owner}/{name}/{number}")
+        r = await self._get(url, headers=headers)
+        if r.status_code == 304 and cached:
+            log.debug("PR #%d not modified; using cached copy", number)
+            return _pr_from_json(number, cached["data"])
         if r.status_code == 404:
             log.warning("PR #%d not found in %s/%s", number, owner, name)
             return None
         try:
             r.raise_for_status()
-        except requests.HTTPError:
+        except httpx.HTTPStatusError:
             log.error("Failed to hydrate PR #%d: %s", number, r.text)
             raise
-        p = r.json()
-        labels = [l["name"].lower() for l in (p.get("labels") or [])]
-        body = p.get("body") or ""
-        body_excerpt = "\n".join((body or "").splitlines()[:10])
-        author = (p.get("user") or {}).get("login") or ""
-        merge_sha = p.get("merge_commit_sha")
-        merged_at = p.get("merged_at")
-        changed_files = p.get("changed_files")
-        return PR(
-            number=number,
-            title=p.get("title") or "",
-            body_excerpt=body_excerpt,
-            labels=labels,
-            author=author,
-            url=p.get("html_url") or "",
-            merge_sha=merge_sha,
-            merged_at=merged_at,
-            changed_files=changed_files,
-        )
+        p = orjson.loads(r.content)
+        _store_etag_entry(path, r.headers.get("ETag"), p)
+        return _pr_from_json(number, p)
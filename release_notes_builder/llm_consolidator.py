@@ -1,17 +1,37 @@
 from __future__ import annotations
 from typing import Any, Dict, List, Tuple, Optional
-import json
+import asyncio
+import hashlib
 import os
-import time
 import logging
+import random
 import re
-from urllib.parse import urlparse
-from openai import OpenAI
+import time
+from itertools import chain
+from pathlib import Path
+from openai import APIConnectionError, AsyncOpenAI, InternalServerError, RateLimitError
+import orjson
 
+from .cache import cache_path, read_json, write_json
 from .schema import is_valid_release, assert_valid_release
+from .utils import unique_preserve_order
 
 log = logging.getLogger(__name__)
 
+# Client-side pacing defaults; override per account tier via llm.rpm / llm.tpm in the config
+DEFAULT_RPM = 500
+DEFAULT_TPM = 200_000
+# Expected completion tokens per call; OpenAI counts these against TPM too (llm.max_tokens)
+DEFAULT_COMPLETION_TOKENS = 2000
+MAX_RATE_LIMIT_RETRIES = 5
+DEFAULT_RATE_LIMIT_DELAY = 1.0
+# Never hold every caller longer than this on a single 429 or transient error
+MAX_RATE_LIMIT_DELAY = 30.0
+RESET_PART_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+RESET_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+GH_PR_URL_RE = re.compile(r"github\.com/([^/]+)/([^/]+)/pull/(\d+)")
+
 SYSTEM_PROMPT = (
     "You are a Release Notes Consolidator. Write concise, user-facing release notes. "
     "Prefer concrete impact and product language over internal implementation. "
@@ -25,6 +45,17 @@ SYSTEM_PROMPT = (
     "TL;DR must be a high-level overview of what is being released (2\u20134 bullets) without linking to repos; focus on themes and user impact."
 )
 
+TLDR_PROMPT = (
+    "You write the TL;DR for release notes that span several repositories. "
+    "Given the consolidated release note bullets, return 2\u20134 high-level bullets about what is being released, "
+    "focused on themes and user impact, without naming repos. "
+    'Respond with strict JSON only: { "tldr": string[] }.'
+)
+
+OUTPUT_SCHEMA_HINT = (
+    "Output schema: { tldr: string[], repos: [{ name: string, sections: [{ title: string, items: [{ text: string, prs: number[] }] }]}], upgrade_notes: string[], contributors: string[] }"
+)
+
 OVERRIDE_USER_MESSAGE = (
     '''
 '''
@@ -33,27 +64,21 @@ OVERRIDE_USER_MESSAGE = (
 
 def build_user_message(snapshots: List[Dict[str, Any]], since_ref: str, until_ref: str) -> str:
     # snapshots: list of { repo: "owner/repo", prs: [ ...compact json... ] }
-    parts = [f"Release window: {since_ref} \u2192 {until_ref}"]
-    for snap in snapshots:
-        parts.append(f"Repo: {snap['repo']}")
-        parts.append("PRs snapshot (JSON):")
-        parts.append(json.dumps(snap["prs"], ensure_ascii=False))
-        parts.append("")
-    parts.append(
-        "Output schema: { tldr: string[], repos: [{ name: string, sections: [{ title: string, items: [{ text: string, prs: number[] }] }]}], upgrade_notes: string[], contributors: string[] }"
+    per_repo = (
+        (f"Repo: {snap['repo']}", "PRs snapshot (JSON):", orjson.dumps(snap["prs"]).decode("utf-8"), "")
+        for snap in snapshots
+    )
+    return "\n".join(
+        chain((f"Release window: {since_ref} \u2192 {until_ref}",), chain.from_iterable(per_repo), (OUTPUT_SCHEMA_HINT,))
     )
-    return "\n".join(parts)
 
 
 def _extract_owner_repo_and_number(url: str) -> Tuple[str, int]:
     # Expect ... github.com/owner/repo/pull/123
-    try:
-        path = urlparse(url).path.strip("/")
-        parts = path.split("/")
-        owner, repo, _, num = parts[0], parts[1], parts[2], parts[3]
-        return f"{owner}/{repo}", int(num)
-    except Exception:
+    m = GH_PR_URL_RE.search(url or "")
+    if not m:
         return "", -1
+    return f"{m.group(1)}/{m.group(2)}", int(m.group(3))
 
 
 def _ensure_required_defaults(doc: Dict[str, Any]) -> Dict[str, Any]:
@@ -69,11 +94,11 @@ def _ensure_required_defaults(doc: Dict[str, Any]) -> Dict[str, Any]:
 
 def _has_minimal_content(doc: Dict[str, Any]) -> bool:
     try:
-        for repo in doc.get("repos", []):
-            for sec in repo.get("sections", []):
-                if any((sec.get("items") or [])):
-                    return True
-        return False
+        return any(
+            sec.get("items")
+            for repo in doc.get("repos", [])
+            for sec in repo.get("sections", [])
+        )
     except Exception:
         return False
 
@@ -127,28 +152,150 @@ def _coerce_legacy(doc: Dict[str, Any]) -> Dict[str, Any]:
     return coerced
 
 
-def consolidate_openai(
-    snapshots: List[Dict[str, Any]],
-    since_ref: str,
-    until_ref: str,
+def _parse_reset(value: Optional[str]) -> Optional[float]:
+    # Retry-After is plain seconds; x-ratelimit-reset-* looks like "1s", "6m0s" or "20ms"
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = RESET_PART_RE.findall(value)
+    if not parts:
+        return None
+    return sum(float(n) * RESET_UNITS[unit] for n, unit in parts)
+
+
+def _rate_limit_delay(e: RateLimitError) -> float:
+    headers = e.response.headers if e.response is not None else {}
+    delay = _parse_reset(headers.get("retry-after"))
+    if delay is None:
+        # x-ratelimit-reset-* is the time until that bucket is completely full again, so only
+        # look at the limit(s) that actually ran out
+        resets = [
+            _parse_reset(headers.get(f"x-ratelimit-reset-{kind}"))
+            for kind in ("requests", "tokens")
+            if headers.get(f"x-ratelimit-remaining-{kind}") == "0"
+        ]
+        delay = max((d for d in resets if d is not None), default=DEFAULT_RATE_LIMIT_DELAY)
+    return min(delay, MAX_RATE_LIMIT_DELAY)
+
+
+class _TokenBucket:
+    # Paces requests under requests-per-minute and tokens-per-minute budgets so we wait locally
+    # instead of spending a round-trip on a request that is certain to get a 429.
+    def __init__(self, rpm: int, tpm: int, completion_tokens: int = 0):
+        self.rpm = max(1, rpm)
+        self.tpm = max(1, tpm)
+        # Added to every request's prompt estimate
+        self.completion_tokens = max(0, completion_tokens)
+        self._requests = float(self.rpm)
+        self._tokens = float(self.tpm)
+        self._updated = time.monotonic()
+        self._resume_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    async def acquire(self, tokens: int) -> None:
+        # A request bigger than the whole budget still goes out once the bucket is full
+        tokens = min(tokens + self.completion_tokens, self.tpm)
+        async with self._lock:
+            while True:
+                self._refill()
+                wait = self._resume_at - time.monotonic()
+                if wait <= 0:
+                    if self._requests >= 1 and self._tokens >= tokens:
+                        self._requests -= 1
+                        self._tokens -= tokens
+                        return
+                    wait = max((1 - self._requests) * 60 / self.rpm, (tokens - self._tokens) * 60 / self.tpm)
+                await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        # The server says we're over budget; hold every caller until its reset time
+        self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+        self._requests = 0.0
+
+
+async def _chat(client: AsyncOpenAI, sem: asyncio.Semaphore, bucket: _TokenBucket, **kwargs: Any) -> str:
+    # Rough estimate (~4 chars per token) is enough for pacing; the bucket adds the completion budget.
+    # The client is built with max_retries=0, so this loop is the only retry policy.
+    tokens = sum(len(m["content"]) for m in kwargs["messages"]) // 4
+    attempt = 0
+    while True:
+        await bucket.acquire(tokens)
+        try:
+            async with sem:
+                resp = await client.chat.completions.create(**kwargs)
+            return resp.choices[0].message.content or ""
+        except RateLimitError as e:
+            # Out of credit is not going to recover by waiting
+            if e.code == "insufficient_quota" or attempt == MAX_RATE_LIMIT_RETRIES:
+                raise
+            delay = _rate_limit_delay(e)
+            log.warning("OpenAI rate limit hit; pausing requests for %.1fs", delay)
+            bucket.pause(delay)
+        except (APIConnectionError, InternalServerError) as e:
+            if attempt == MAX_RATE_LIMIT_RETRIES:
+                raise
+            delay = min(0.5 * 2 ** attempt + random.uniform(0, 0.5), MAX_RATE_LIMIT_DELAY)
+            log.warning("OpenAI request failed (%s); retrying in %.1fs", e, delay)
+            await asyncio.sleep(delay)
+        attempt += 1
+
+
+def _llm_cache_file(model: str, temperature: float, system_prompt: str, user_msg: str) -> Optional[Path]:
+    # Identical prompts get identical answers for our purposes, so key on everything that goes into the request
+    key = hashlib.sha256(f"{model}|{temperature}|{system_prompt}|{user_msg}".encode("utf-8")).hexdigest()
+    return cache_path("llm", key)
+
+
+async def _consolidate(
+    client: AsyncOpenAI,
+    sem: asyncio.Semaphore,
+    bucket: _TokenBucket,
+    user_msg: str,
     model: str,
     temperature: float,
-    api_key: Optional[str] = None,
-    use_override: bool = False,
+    use_cache: bool = True,
 ) -> Dict[str, Any]:
-    key = api_key or os.getenv("OPENAI_API_KEY")
-    if not key:
-        raise RuntimeError("OPENAI_API_KEY not set and no api_key provided")
-    client = OpenAI(api_key=key)
+    # use_cache=False skips the lookup but still stores the fresh result
+    cache_file = _llm_cache_file(model, temperature, SYSTEM_PROMPT, user_msg)
+    cached = read_json(cache_file) if use_cache else None
+    if cached is not None:
+        log.info("Using cached LLM output from %s", cache_file)
+        return cached
+    data = await _consolidate_uncached(client, sem, bucket, user_msg, model, temperature)
+    write_json(cache_file, data)
+    return data
 
-    user_msg = OVERRIDE_USER_MESSAGE if use_override else build_user_message(snapshots, since_ref, until_ref)
-    log.debug("LLM request prepared: model=%s, user_msg_chars=%d", model, len(user_msg))
-    log.debug("LLM System prompt:\n%s", SYSTEM_PROMPT)
-    log.debug("LLM User message:\n%s", user_msg)
+
+async def _consolidate_uncached(
+    client: AsyncOpenAI,
+    sem: asyncio.Semaphore,
+    bucket: _TokenBucket,
+    user_msg: str,
+    model: str,
+    temperature: float,
+) -> Dict[str, Any]:
+    # Prompts can be tens of KB; don't build debug records for them unless DEBUG is on
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("LLM request prepared: model=%s, user_msg_chars=%d", model, len(user_msg))
+        log.debug("LLM System prompt:\n%s", SYSTEM_PROMPT)
+        log.debug("LLM User message:\n%s", user_msg)
 
     for attempt in range(3):
         log.info("LLM consolidate attempt %d (model=%s)", attempt + 1, model)
-        resp = client.chat.completions.create(
+        content = await _chat(
+            client,
+            sem,
+            bucket,
             model=model,
             temperature=temperature,
             response_format={"type": "json_object"},
@@ -157,10 +304,9 @@ def consolidate_openai(
                 {"role": "user", "content": user_msg},
             ],
         )
-        content = resp.choices[0].message.content
         log.debug("LLM raw response chars=%d", len(content or ""))
         try:
-            data = json.loads(content)
+            data = orjson.loads(content)
             data = _ensure_required_defaults(data)
             if is_valid_release(data) and _has_minimal_content(data):
                 log.info("LLM output validated successfully on attempt %d", attempt + 1)
@@ -177,7 +323,6 @@ def consolidate_openai(
             log.warning("LLM output invalid or empty on attempt %d", attempt + 1)
         except Exception as e:
             log.warning("Failed to parse LLM JSON on attempt %d: %s", attempt + 1, e)
-        time.sleep(1.2 * (attempt + 1))
 
     # Final attempt: enforce validation error message and ask model to repair
     repair_prompt = (
@@ -185,7 +330,10 @@ def consolidate_openai(
         "Return a corrected JSON that strictly matches the schema and includes non-empty sections with items for all repos that have PRs."
     )
     log.info("LLM repair attempt (strict JSON)")
-    resp = client.chat.completions.create(
+    content = await _chat(
+        client,
+        sem,
+        bucket,
         model=model,
         temperature=0.0,
         response_format={"type": "json_object"},
@@ -195,8 +343,7 @@ def consolidate_openai(
             {"role": "user", "content": repair_prompt},
         ],
     )
-    content = resp.choices[0].message.content
-    data = json.loads(content)
+    data = orjson.loads(content)
     data = _ensure_required_defaults(data)
     if is_valid_release(data) and _has_minimal_content(data):
         log.info("LLM repair output validated successfully")
@@ -213,3 +360,220 @@ def consolidate_openai(
     # If still invalid/empty, raise with validation error
     assert_valid_release(data)
     raise ValueError("LLM produced an empty release document (no items)")
+
+
+def _resolve_api_key(api_key: Optional[str]) -> str:
+    key = api_key or os.getenv("OPENAI_API_KEY")
+    if not key:
+        raise RuntimeError("OPENAI_API_KEY not set and no api_key provided")
+    return key
+
+
+async def aconsolidate_openai(
+    snapshots: List[Dict[str, Any]],
+    since_ref: str,
+    until_ref: str,
+    model: str,
+    temperature: float,
+    api_key: Optional[str] = None,
+    use_override: bool = False,
+    use_cache: bool = True,
+    rpm: int = DEFAULT_RPM,
+    tpm: int = DEFAULT_TPM,
+    completion_tokens: int = DEFAULT_COMPLETION_TOKENS,
+) -> Dict[str, Any]:
+    client = AsyncOpenAI(api_key=_resolve_api_key(api_key), max_retries=0)
+    user_msg = OVERRIDE_USER_MESSAGE if use_override else build_user_message(snapshots, since_ref, until_ref)
+    try:
+        bucket = _TokenBucket(rpm, tpm, completion_tokens)
+        return await _consolidate(
+            client, asyncio.Semaphore(1), bucket, user_msg, model, temperature, use_cache=use_cache
+        )
+    finally:
+        await client.close()
+
+
+def consolidate_openai(
+    snapshots: List[Dict[str, Any]],
+    since_ref: str,
+    until_ref: str,
+    model: str,
+    temperature: float,
+    api_key: Optional[str] = None,
+    use_override: bool = False,
+    use_cache: bool = True,
+    rpm: int = DEFAULT_RPM,
+    tpm: int = DEFAULT_TPM,
+    completion_tokens: int = DEFAULT_COMPLETION_TOKENS,
+) -> Dict[str, Any]:
+    return asyncio.run(
+        aconsolidate_openai(
+            snapshots,
+            since_ref,
+            until_ref,
+            model,
+            temperature,
+            api_key=api_key,
+            use_override=use_override,
+            use_cache=use_cache,
+            rpm=rpm,
+            tpm=tpm,
+            completion_tokens=completion_tokens,
+        )
+    )
+
+
+def _merge_tldr(tldrs: List[List[str]], limit: int = 4) -> List[str]:
+    # Round-robin so every repo contributes its headline bullet before any repo gets a second one
+    merged: List[str] = []
+    for rank in range(max((len(t) for t in tldrs), default=0)):
+        for t in tldrs:
+            if rank < len(t):
+                merged.append(t[rank])
+    merged = unique_preserve_order(merged)
+    return merged[:max(limit, len(tldrs))]
+
+
+async def _consolidate_one_repo(
+    client: AsyncOpenAI,
+    sem: asyncio.Semaphore,
+    bucket: _TokenBucket,
+    snap: Dict[str, Any],
+    since_ref: str,
+    until_ref: str,
+    model: str,
+    temperature: float,
+    use_cache: bool = True,
+) -> Dict[str, Any]:
+    log.info("Consolidating %s (%d PRs)", snap["repo"], len(snap["prs"]))
+    doc = await _consolidate(
+        client, sem, bucket, build_user_message([snap], since_ref, until_ref), model, temperature, use_cache=use_cache
+    )
+    repos = doc.get("repos") or []
+    if len(repos) == 1:
+        repos[0]["name"] = snap["repo"]
+    return doc
+
+
+async def _summarize_tldr(
+    client: AsyncOpenAI,
+    sem: asyncio.Semaphore,
+    bucket: _TokenBucket,
+    repos: List[Dict[str, Any]],
+    since_ref: str,
+    until_ref: str,
+    model: str,
+    temperature: float,
+    use_cache: bool = True,
+) -> List[str]:
+    # Only the consolidated bullets go in, so this prompt stays small however many PRs there were
+    lines = [f"Release window: {since_ref} \u2192 {until_ref}"]
+    for repo in repos:
+        for sec in repo.get("sections") or []:
+            lines.append(f"{sec.get('title')}:")
+            lines.extend(f"- {it.get('text')}" for it in sec.get("items") or [])
+    user_msg = "\n".join(lines)
+    cache_file = _llm_cache_file(model, temperature, TLDR_PROMPT, user_msg)
+    cached = read_json(cache_file) if use_cache else None
+    if cached is not None:
+        log.info("Using cached TL;DR from %s", cache_file)
+        return cached
+    content = await _chat(
+        client,
+        sem,
+        bucket,
+        model=model,
+        temperature=temperature,
+        response_format={"type": "json_object"},
+        messages=[
+            {"role": "system", "content": TLDR_PROMPT},
+            {"role": "user", "content": user_msg},
+        ],
+    )
+    tldr = orjson.loads(content).get("tldr")
+    if not isinstance(tldr, list) or not all(isinstance(t, str) for t in tldr):
+        raise ValueError("TL;DR response has no string list under 'tldr'")
+    write_json(cache_file, tldr)
+    return tldr
+
+
+async def aconsolidate_openai_chunks(
+    chunks: List[Dict[str, Any]],
+    since_ref: str,
+    until_ref: str,
+    model: str,
+    temperature: float,
+    api_key: Optional[str] = None,
+    max_concurrency: int = 4,
+    use_cache: bool = True,
+    rpm: int = DEFAULT_RPM,
+    tpm: int = DEFAULT_TPM,
+    completion_tokens: int = DEFAULT_COMPLETION_TOKENS,
+) -> Dict[str, Any]:
+    # Map: consolidate each repo snapshot in its own request, up to max_concurrency at a time, so
+    # prompts stay small and a failure retries a single repo. Reduce: merge the documents locally
+    # and ask for a cross-repo TL;DR in one small follow-up call.
+    client = AsyncOpenAI(api_key=_resolve_api_key(api_key), max_retries=0)
+    sem = asyncio.Semaphore(max(1, max_concurrency))
+    bucket = _TokenBucket(rpm, tpm, completion_tokens)
+    try:
+        docs = await asyncio.gather(
+            *(
+                _consolidate_one_repo(
+                    client, sem, bucket, snap, since_ref, until_ref, model, temperature, use_cache=use_cache
+                )
+                for snap in chunks
+            )
+        )
+        merged: Dict[str, Any] = {"tldr": [], "repos": [], "upgrade_notes": [], "contributors": []}
+        for doc in docs:
+            merged["repos"].extend(doc.get("repos") or [])
+            merged["upgrade_notes"].extend(doc.get("upgrade_notes") or [])
+            merged["contributors"].extend(doc.get("contributors") or [])
+        merged["upgrade_notes"] = unique_preserve_order(merged["upgrade_notes"])
+        merged["contributors"] = unique_preserve_order(merged["contributors"])
+
+        tldrs = [doc.get("tldr") or [] for doc in docs]
+        if len(docs) > 1:
+            try:
+                merged["tldr"] = await _summarize_tldr(
+                    client, sem, bucket, merged["repos"], since_ref, until_ref, model, temperature, use_cache=use_cache
+                )
+            except Exception as e:
+                log.warning("TL;DR summarization failed; merging per-repo TL;DRs instead: %s", e)
+                merged["tldr"] = _merge_tldr(tldrs)
+        else:
+            merged["tldr"] = _merge_tldr(tldrs)
+    finally:
+        await client.close()
+    return merged
+
+
+def consolidate_openai_chunks(
+    chunks: List[Dict[str, Any]],
+    since_ref: str,
+    until_ref: str,
+    model: str,
+    temperature: float,
+    api_key: Optional[str] = None,
+    max_concurrency: int = 4,
+    use_cache: bool = True,
+    rpm: int = DEFAULT_RPM,
+    tpm: int = DEFAULT_TPM,
+    completion_tokens: int = DEFAULT_COMPLETION_TOKENS,
+) -> Dict[str, Any]:
+    return asyncio.run(
+        aconsolidate_openai_chunks(
+            chunks,
+            since_ref,
+            until_ref,
+            model,
+            temperature,
+            api_key=api_key,
+            max_concurrency=max_concurrency,
+            use_cache=use_cache,
+            rpm=rpm,
+            tpm=tpm,
+            completion_tokens=completion_tokens,
+        )
+    )
@@ -12,8 +12,22 @@ CATEGORIES = [
     "Chore",
 ]
 
+CONVENTIONAL_PREFIX_RE = re.compile(r"^(feat|fix|perf|docs|chore|refactor)(!:|:|\(.*\)(!:|:))", re.IGNORECASE)
 
-@dataclass
+# Label sets used by classify(); matched with set intersection
+BREAKING_LABELS = frozenset({"breaking", "breaking-change"})
+FEATURE_LABELS = frozenset({"feature", "enhancement", "type:feat", "feat"})
+FIX_LABELS = frozenset({"bug", "fix", "type:bug"})
+PERF_LABELS = frozenset({"perf", "performance"})
+DOC_LABELS = frozenset({"docs", "documentation"})
+CHORE_LABELS = frozenset({"refactor", "chore"})
+
+# Tooling/dependency PRs that are listed verbatim instead of being summarized by the LLM
+TRIVIAL_TITLE_RE = re.compile(r"^(chore|deps|build|ci)(\(.+\))?:", re.IGNORECASE)
+TRIVIAL_LABEL_MARKERS = ("dependencies", "renovate")
+
+
+@dataclass(slots=True)
 class ClassifiedPR:
     pr: PR
     category: str
@@ -22,25 +36,21 @@ class ClassifiedPR:
 
 
 def detect_conventional_prefix(title: str) -> Optional[str]:
-    m = re.match(r"^(feat|fix|perf|docs|chore|refactor)(!:|:|\(.*\)(!:|:))", title.strip(), re.IGNORECASE)
-    if m:
-        kind = m.group(1).lower()
-        return kind
-    return None
+    m = CONVENTIONAL_PREFIX_RE.match(title.strip())
+    return m.group(1).lower() if m else None
 
 
 def classify(pr: PR) -> ClassifiedPR:
     title = pr.title or ""
-    labels = set([l.lower() for l in pr.labels or []])
+    labels = pr.labels_norm
     body = pr.body_excerpt or ""
 
-    # breaking detector
-    breaking = any([
-        "breaking" in labels,
-        "breaking change" in (body.lower()),
-        "breaking-change" in labels,
-        "!" in title.split(" ")[0] if title else False,
-    ])
+    # breaking detector (short-circuits; cheapest checks first)
+    breaking = (
+        bool(labels & BREAKING_LABELS)
+        or "!" in title.partition(" ")[0]
+        or "breaking change" in body.lower()
+    )
 
     conventional = detect_conventional_prefix(title) or ""
 
@@ -53,15 +63,15 @@ def classify(pr: PR) -> ClassifiedPR:
     # Primary label-based mapping (restricted to 3 classes)
     if breaking:
         cat = "Features"  # treat breaking as feature-level change
-    elif any(l in labels for l in ["feature", "enhancement", "type:feat", "feat"]):
+    elif labels & FEATURE_LABELS:
         cat = "Features"
-    elif any(l in labels for l in ["bug", "fix", "type:bug"]):
+    elif labels & FIX_LABELS:
         cat = "Fixes"
-    elif any(l in labels for l in ["perf", "performance"]):
+    elif labels & PERF_LABELS:
         cat = "Fixes"  # performance -> fixes bucket
-    elif any(l in labels for l in ["docs", "documentation"]):
+    elif labels & DOC_LABELS:
         cat = "Chore"  # docs -> chore
-    elif any(l in labels for l in ["refactor", "chore"]):
+    elif labels & CHORE_LABELS:
         cat = "Chore"
 
     # Conventional commit overrides (restricted)
@@ -79,6 +89,30 @@ def classify(pr: PR) -> ClassifiedPR:
     return ClassifiedPR(pr=pr, category=cat, area=area, is_breaking=breaking)
 
 
+def is_trivial(c: ClassifiedPR) -> bool:
+    if c.is_breaking:
+        return False
+    if TRIVIAL_TITLE_RE.match((c.pr.title or "").strip()):
+        return True
+    return any(marker in l for l in c.pr.labels or [] for marker in TRIVIAL_LABEL_MARKERS)
+
+
+def split_trivial(classified: List[ClassifiedPR]) -> Tuple[List[ClassifiedPR], List[ClassifiedPR]]:
+    # Returns (needs_llm, trivial)
+    needs_llm: List[ClassifiedPR] = []
+    trivial: List[ClassifiedPR] = []
+    for c in classified:
+        (trivial if is_trivial(c) else needs_llm).append(c)
+    return needs_llm, trivial
+
+
+def summarize_chores(repo: str, trivial: List[ClassifiedPR]) -> List[Dict]:
+    return [
+        {"repo": repo, "number": c.pr.number, "title": c.pr.title, "url": c.pr.url}
+        for c in trivial
+    ]
+
+
 def summarize_for_llm(classified: List[ClassifiedPR]) -> List[Dict]:
     out = []
     for c in classified:
@@ -9,12 +9,10 @@ def _product_for_repo(full_name: str) -> str:
     name = full_name.lower()
     if name.endswith("/ya-webapp") or "syrup" in name:
         return "Syrup"
-    if "/hq" in name or name.endswith("/hq"):
+    if "/hq" in name:
         return "hq"
     if "api" in name:
         return "API"
-    if name.endswith("/ya-webapp"):
-        return "Webapp"
     return full_name
 
 
@@ -34,15 +32,13 @@ def render_md(doc: Dict) -> str:
     title = doc.get("title") or "Offchain Release"
     today = datetime.utcnow().strftime("%Y-%m-%d")
     lines: List[str] = []
-    lines.append(f"# {title} ({today})")
-    lines.append("")
+    lines.extend((f"# {title} ({today})", ""))
 
     # Focus areas from TL;DR
     tldr = doc.get("tldr") or []
     if tldr:
         lines.append("Focus areas for the week:")
-        for b in tldr[:10]:
-            lines.append(f"- {b}")
+        lines.extend(f"- {b}" for b in tldr[:10])
         lines.append("")
 
     # Collect bullets per product
@@ -50,35 +46,39 @@ def render_md(doc: Dict) -> str:
 
     for repo in doc.get("repos", []):
         repo_name = repo.get("name") or "unknown/unknown"
-        product = _product_for_repo(repo_name)
+        bullets = products.setdefault(_product_for_repo(repo_name), [])
+        prefix = f"https://github.com/{repo_name}/pull/"
         for sec in repo.get("sections", []):
             title = (sec.get("title") or "").strip()
             emoji = _emoji_for_category(title)
             for item in sec.get("items", []):
                 text = item.get("text") or ""
-                prs = item.get("prs") or []
-                pr_links = " ".join([f"[PR #{n}](https://github.com/{repo_name}/pull/{n})" for n in prs])
-                bullet = f"- {emoji} {text}".strip()
-                if pr_links:
-                    bullet += f" {pr_links}"
-                products.setdefault(product, []).append(bullet)
+                pr_links = " ".join(f"[PR #{n}]({prefix}{n})" for n in item.get("prs") or [])
+                bullet = f"- {emoji} {text}" if emoji else f"- {text}"
+                bullets.append(f"{bullet} {pr_links}" if pr_links else bullet)
 
-    # Render products in preferred order
-    for product in products:
-        items = products.get(product) or []
+    # Render products in first-seen order
+    for product, items in products.items():
         if not items:
             continue
         lines.append(f"**{product}**")
-        for b in items:
-            lines.append(b)
+        lines.extend(items)
         lines.append("")
 
+    # Trivial PRs that bypassed the LLM, collapsed so they don't crowd the notes
+    chores = doc.get("chores") or []
+    if chores:
+        lines.extend(("<details>", f"<summary>Chores ({len(chores)})</summary>", ""))
+        for c in chores:
+            product = _product_for_repo(c.get("repo") or "unknown/unknown")
+            lines.append(f"- **{product}** {c.get('title') or ''} [PR #{c['number']}]({c.get('url') or ''})")
+        lines.extend(("", "</details>", ""))
+
     # Upgrade notes
     upg = doc.get("upgrade_notes") or []
     if upg:
         lines.append("Upgrade notes:")
-        for note in upg:
-            lines.append(f"- {note}")
+        lines.extend(f"- {note}" for note in upg)
         lines.append("")
 
 
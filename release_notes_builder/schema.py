@@ -1,6 +1,8 @@
 from __future__ import annotations
 from typing import Any, Dict
-from jsonschema import validate, Draft7Validator, ValidationError
+import fastjsonschema
+from jsonschema import Draft7Validator, ValidationError
+from jsonschema.exceptions import best_match
 
 RELEASE_SCHEMA: Dict[str, Any] = {
     "type": "object",
@@ -56,10 +58,25 @@ RELEASE_SCHEMA: Dict[str, Any] = {
 }
 
 
+# Compiled once into plain Python; much faster than interpreting the schema on every check
+_FAST_VALIDATE = fastjsonschema.compile(RELEASE_SCHEMA)
+# Only used to build a descriptive ValidationError once validation has already failed
+_VALIDATOR = Draft7Validator(RELEASE_SCHEMA)
+
+
 def is_valid_release(obj: Dict[str, Any]) -> bool:
-    v = Draft7Validator(RELEASE_SCHEMA)
-    return v.is_valid(obj)
+    try:
+        _FAST_VALIDATE(obj)
+    except fastjsonschema.JsonSchemaException:
+        return False
+    return True
 
 
 def assert_valid_release(obj: Dict[str, Any]) -> None:
-    validate(obj, RELEASE_SCHEMA)
+    if is_valid_release(obj):
+        return
+    # Same error selection as jsonschema.validate(), so callers keep getting a ValidationError
+    error = best_match(_VALIDATOR.iter_errors(obj))
+    if error is not None:
+        raise error
+    raise ValidationError("release document does not match RELEASE_SCHEMA")
@@ -1,9 +1,17 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional, Dict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import asyncio
 import logging
 import re
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .cache import cache_path, read_json, write_json
 
 
 log = logging.getLogger(__name__)
@@ -12,8 +20,15 @@ log = logging.getLogger(__name__)
 STORY_URL_RE = re.compile(r"https?://app\.shortcut\.com/[^/]+/story/(\d+)")
 SC_PREFIX_RE = re.compile(r"\bsc-(\d{3,})\b", re.IGNORECASE)
 
+SHORTCUT_API = "https://api.app.shortcut.com/api/v3"
+# Stories are edited occasionally, so on-disk copies expire after a day
+STORY_CACHE_TTL = 24 * 60 * 60
+# Shortcut rate limiting and transient server errors
+SC_RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_STORY_WORKERS = 16
+
 
-@dataclass
+@dataclass(slots=True)
 class ShortcutStory:
     id: int
     name: str
@@ -23,13 +38,25 @@ class ShortcutStory:
     estimate: Optional[int]
 
 
-class ShortcutFetcher:
+def _story_from_json(data: Dict) -> ShortcutStory:
+    return ShortcutStory(
+        id=data.get("id"),
+        name=data.get("name") or "",
+        app_url=data.get("app_url") or "",
+        description=data.get("description"),
+        state=(data.get("workflow_state") or {}).get("name"),
+        estimate=data.get("estimate"),
+    )
+
+
+class _StoryStore:
+    # Story id extraction plus the memo/disk cache shared by the sync and async fetchers
+
     def __init__(self, token: Optional[str]):
         self.token = token
         self.enabled = bool(token)
-        self.session = requests.Session()
-        if token:
-            self.session.headers.update({"Shortcut-Token": token})
+        # Per-process memo; None records stories known not to exist
+        self._stories: Dict[int, Optional[ShortcutStory]] = {}
 
     def extract_story_id(self, title: str, body: str) -> Optional[int]:
         # Prefer explicit URL in body
@@ -49,25 +76,162 @@ class ShortcutFetcher:
                     continue
         return None
 
+    def _cached_story(self, story_id: int) -> Tuple[bool, Optional[ShortcutStory]]:
+        # Returns (hit, story); a hit with story=None means the story is known not to exist
+        if story_id in self._stories:
+            return True, self._stories[story_id]
+        data = read_json(cache_path("shortcut", str(story_id)), max_age=STORY_CACHE_TTL)
+        if data is not None:
+            story = self._stories[story_id] = _story_from_json(data)
+            return True, story
+        return False, None
+
+    def _remember(self, data: Dict) -> ShortcutStory:
+        write_json(cache_path("shortcut", str(data["id"])), data)
+        story = self._stories[data["id"]] = _story_from_json(data)
+        return story
+
+    def _split_cached(self, story_ids: Iterable[int]) -> Tuple[Dict[int, ShortcutStory], List[int]]:
+        # Returns (stories already known, ids that still need a request), deduped in input order
+        found: Dict[int, ShortcutStory] = {}
+        missing: List[int] = []
+        for sid in dict.fromkeys(story_ids):
+            hit, story = self._cached_story(sid)
+            if not hit:
+                missing.append(sid)
+            elif story:
+                found[sid] = story
+        return found, missing
+
+
+class ShortcutFetcher(_StoryStore):
+    def __init__(self, token: Optional[str]):
+        super().__init__(token)
+        self.session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=SC_RETRY_STATUSES,
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        self.session.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry))
+        if token:
+            self.session.headers.update({"Shortcut-Token": token})
+
     def get_story(self, story_id: int) -> Optional[ShortcutStory]:
         if not self.enabled:
             return None
-        url = f"https://api.app.shortcut.com/api/v3/stories/{story_id}"
+        hit, story = self._cached_story(story_id)
+        if hit:
+            return story
+        url = f"{SHORTCUT_API}/stories/{story_id}"
         try:
             r = self.session.get(url, timeout=15)
             if r.status_code == 404:
                 log.warning("Shortcut story %s not found", story_id)
+                self._stories[story_id] = None
                 return None
             r.raise_for_status()
             data = r.json()
-            return ShortcutStory(
-                id=data.get("id"),
-                name=data.get("name") or "",
-                app_url=data.get("app_url") or "",
-                description=data.get("description"),
-                state=(data.get("workflow_state") or {}).get("name"),
-                estimate=data.get("estimate"),
-            )
         except requests.RequestException as e:
             log.warning("Shortcut API error for story %s: %s", story_id, e)
             return None
+        return self._remember(data)
+
+    def get_stories(self, story_ids: Iterable[int]) -> Dict[int, ShortcutStory]:
+        if not self.enabled:
+            return {}
+        found, missing = self._split_cached(story_ids)
+        if not missing:
+            return found
+        # Each uncached id is looked up once, concurrently over the pooled session
+        with ThreadPoolExecutor(max_workers=min(MAX_STORY_WORKERS, len(missing))) as ex:
+            for sid, story in zip(missing, ex.map(self.get_story, missing)):
+                if story:
+                    found[sid] = story
+        return found
+
+
+class AsyncShortcutFetcher(_StoryStore):
+    """asyncio counterpart of ShortcutFetcher built on an HTTP/2 httpx client.
+
+    Use as ``async with AsyncShortcutFetcher(token) as sc: ...`` so the client is closed.
+    """
+
+    MAX_RETRIES = 3
+
+    def __init__(self, token: Optional[str], max_connections: int = MAX_STORY_WORKERS):
+        super().__init__(token)
+        self._client = httpx.AsyncClient(
+            base_url=SHORTCUT_API,
+            headers={"Shortcut-Token": token} if token else None,
+            http2=True,
+            limits=httpx.Limits(max_connections=max_connections),
+            timeout=15,
+        )
+        # HTTP/2 multiplexes streams over one connection, so bound in-flight requests explicitly
+        self._sem = asyncio.Semaphore(max_connections)
+        # Lookups still in flight, so concurrent callers (e.g. several repos) share one request per story
+        self._lookups: Dict[int, asyncio.Task] = {}
+
+    async def __aenter__(self) -> "AsyncShortcutFetcher":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def _get(self, url: str) -> httpx.Response:
+        # Mirror ShortcutFetcher's retry policy: backoff on SC_RETRY_STATUSES, honouring Retry-After
+        for attempt in range(self.MAX_RETRIES + 1):
+            async with self._sem:
+                r = await self._client.get(url)
+            if r.status_code not in SC_RETRY_STATUSES or attempt == self.MAX_RETRIES:
+                return r
+            retry_after = r.headers.get("Retry-After")
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else 0.3 * 2 ** attempt
+            log.debug("Shortcut returned %d for %s; retrying in %.1fs", r.status_code, url, delay)
+            await asyncio.sleep(delay)
+        return r
+
+    async def get_story(self, story_id: int) -> Optional[ShortcutStory]:
+        if not self.enabled:
+            return None
+        hit, story = self._cached_story(story_id)
+        if hit:
+            return story
+        task = self._lookups.get(story_id)
+        if task is None:
+            task = self._lookups[story_id] = asyncio.create_task(self._fetch_story(story_id))
+            task.add_done_callback(lambda _: self._lookups.pop(story_id, None))
+        # Shielded so one cancelled caller doesn't cancel the lookup for everyone else awaiting it
+        return await asyncio.shield(task)
+
+    async def _fetch_story(self, story_id: int) -> Optional[ShortcutStory]:
+        try:
+            r = await self._get(f"/stories/{story_id}")
+            if r.status_code == 404:
+                log.warning("Shortcut story %s not found", story_id)
+                self._stories[story_id] = None
+                return None
+            r.raise_for_status()
+            data = orjson.loads(r.content)
+        except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+            log.warning("Shortcut API error for story %s: %s", story_id, e)
+            return None
+        return self._remember(data)
+
+    async def get_stories(self, story_ids: Iterable[int]) -> Dict[int, ShortcutStory]:
+        if not self.enabled:
+            return {}
+        found, missing = self._split_cached(story_ids)
+        if not missing:
+            return found
+        # Uncached ids go out concurrently, bounded by the client's semaphore
+        for sid, story in zip(missing, await asyncio.gather(*(self.get_story(sid) for sid in missing))):
+            if story:
+                found[sid] = story
+        return found
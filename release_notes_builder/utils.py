@@ -1,6 +1,14 @@
 from datetime import datetime
-from typing import Iterable, List
+from typing import Dict, Iterable, List, Mapping, Optional
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Rate limiting and transient server errors. 403 is only retried when it is a rate limit (see gh_rate_limit_wait).
+GH_RETRY_STATUSES = (429, 500, 502, 503, 504)
+# Longer primary rate-limit resets are surfaced as errors rather than waited out
+GH_MAX_RATE_LIMIT_WAIT = 60
 
 
 def iso_dt(dt: datetime) -> str:
@@ -8,26 +16,72 @@ def iso_dt(dt: datetime) -> str:
 
 
 def chunk_lines(text: str, max_lines: int = 12) -> str:
-    lines = (text or "").splitlines()
-    return "\n".join(lines[:max_lines])
+    # Scan only the first max_lines lines rather than splitting the whole (possibly huge) text
+    text = text or ""
+    lines: List[str] = []
+    start, end = 0, len(text)
+    while start < end and len(lines) < max_lines:
+        nl = text.find("\n", start)
+        if nl == -1:
+            nl = end
+        line = text[start:nl]
+        lines.append(line[:-1] if line.endswith("\r") else line)
+        start = nl + 1
+    return "\n".join(lines)
 
 
-def make_gh_session(token: str) -> requests.Session:
-    s = requests.Session()
-    s.headers.update({
+def gh_headers(token: str) -> Dict[str, str]:
+    return {
         "Authorization": f"Bearer {token}",
         "Accept": "application/vnd.github+json",
         "X-GitHub-Api-Version": "2022-11-28",
         "User-Agent": "release-notes-builder/0.1",
-    })
+    }
+
+
+def gh_rate_limit_wait(status_code: int, headers: Mapping[str, str]) -> Optional[float]:
+    # Seconds to wait before retrying a 403 that is really a rate limit; None for a genuine permission error
+    if status_code != 403:
+        return None
+    retry_after = headers.get("Retry-After")
+    if retry_after and retry_after.isdigit():
+        return float(retry_after)
+    reset = headers.get("x-ratelimit-reset")
+    if headers.get("x-ratelimit-remaining") == "0" and reset and reset.isdigit():
+        wait = max(0.0, int(reset) - time.time())
+        if wait <= GH_MAX_RATE_LIMIT_WAIT:
+            return wait
+    return None
+
+
+class GitHubRetry(Retry):
+    # Secondary rate limits come back as 403 with Retry-After; every other 403 fails straight away.
+    # (urllib3 only exposes Retry-After here, so reset-based 403s are retried by the async fetcher only.)
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if status_code == 403 and has_retry_after:
+            return bool(self.total) and self._is_method_retryable(method)
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def make_gh_session(token: str) -> requests.Session:
+    s = requests.Session()
+    s.headers.update(gh_headers(token))
+    # Back off with jitter on GH_RETRY_STATUSES.
+    # POST is only used for read-only GraphQL queries, so it is safe to retry too.
+    retry = GitHubRetry(
+        total=5,
+        backoff_factor=0.5,
+        backoff_jitter=0.5,
+        status_forcelist=GH_RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "POST"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    # Concurrent hydrations share this session; size the keep-alive pool so sockets are reused, not churned
+    s.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry))
     return s
 
 
 def unique_preserve_order(items: Iterable[str]) -> List[str]:
-    seen = set()
-    out: List[str] = []
-    for it in items:
-        if it not in seen:
-            seen.add(it)
-            out.append(it)
-    return out
+    # dict preserves insertion order, so this dedupes in a single C-level pass
+    return list(dict.fromkeys(items))
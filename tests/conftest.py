@@ -0,0 +1,9 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    # Keep tests away from the user's ~/.cache/rlsnotes
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("RLSNOTES_CACHE_DIR", str(cache_dir))
+    return cache_dir
@@ -0,0 +1,44 @@
+import os
+import time
+
+from release_notes_builder.cache import cache_path, read_json, write_json
+
+
+def test_roundtrip(isolated_cache):
+    path = cache_path("ns", "key")
+    assert path == isolated_cache / "ns" / "key.json"
+    assert read_json(path) is None
+    write_json(path, {"a": [1, 2]})
+    assert read_json(path) == {"a": [1, 2]}
+
+
+def test_read_json_ttl():
+    path = cache_path("ns", "old")
+    write_json(path, {"a": 1})
+    assert read_json(path, max_age=60) == {"a": 1}
+    hour_ago = time.time() - 3600
+    os.utime(path, (hour_ago, hour_ago))
+    assert read_json(path, max_age=60) is None
+    assert read_json(path) == {"a": 1}
+
+
+def test_write_json_replaces_without_leftovers():
+    path = cache_path("ns", "key")
+    write_json(path, {"v": 1})
+    write_json(path, {"v": 2})
+    assert read_json(path) == {"v": 2}
+    assert [p.name for p in path.parent.iterdir()] == ["key.json"]
+
+
+def test_unreadable_entry_is_a_miss():
+    path = cache_path("ns", "broken")
+    path.parent.mkdir(parents=True)
+    path.write_text("{not json", encoding="utf-8")
+    assert read_json(path) is None
+
+
+def test_cache_off(monkeypatch):
+    monkeypatch.setenv("RLSNOTES_CACHE_DIR", "off")
+    assert cache_path("ns", "key") is None
+    write_json(None, {"a": 1})
+    assert read_json(None) is None
@@ -0,0 +1,39 @@
+import asyncio
+
+from release_notes_builder import cli
+from release_notes_builder.config import RepoSpec
+from release_notes_builder.github_fetcher import PR, AsyncGitHubFetcher
+
+
+def _pr(number, title):
+    return PR(
+        number=number,
+        title=title,
+        body_excerpt="",
+        labels=[],
+        author="dev",
+        url=f"https://github.com/acme/app/pull/{number}",
+        merge_sha=None,
+        merged_at=None,
+    )
+
+
+def test_fetch_all_returns_per_repo_summaries(monkeypatch):
+    fetched = {
+        "app": [_pr(1, "feat: add export"), _pr(2, "chore(deps): bump lodash")],
+        "docs": [_pr(3, "ci: cache deps")],
+    }
+
+    async def fetch_prs(self, owner, name, since_ref, until_ref, since_date):
+        return fetched[name]
+
+    monkeypatch.setattr(AsyncGitHubFetcher, "fetch_prs", fetch_prs)
+    repos = [RepoSpec("acme", "app"), RepoSpec("acme", "docs")]
+    summaries = asyncio.run(cli._fetch_all("token", None, repos, "v2", None, 2))
+
+    (app_snap, app_chores, app_contributors), (docs_snap, docs_chores, _) = summaries
+    assert app_snap["repo"] == "acme/app"
+    assert [p["number"] for p in app_snap["prs"]] == [1]
+    assert [c["number"] for c in app_chores] == [2]
+    assert app_contributors == ["@dev", "@dev"]
+    assert docs_snap["prs"] == [] and len(docs_chores) == 1
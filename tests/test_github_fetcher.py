@@ -0,0 +1,188 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from release_notes_builder.github_fetcher import (
+    AsyncGitHubFetcher,
+    GitHubFetcher,
+    GraphQLError,
+    _parse_graphql_search,
+    _pr_from_json,
+)
+
+
+def _run(handler, call):
+    async def go():
+        gh = AsyncGitHubFetcher("token")
+        await gh.client.aclose()
+        gh.client = httpx.AsyncClient(base_url="https://api.github.com", transport=httpx.MockTransport(handler))
+        async with gh:
+            return await call(gh)
+
+    return asyncio.run(go())
+
+
+def test_permission_403_is_not_retried():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(403, json={"message": "Resource not accessible"})
+
+    assert _run(handler, lambda gh: gh._get("/repos/o/r/pulls/1")).status_code == 403
+    assert len(calls) == 1
+
+
+def test_secondary_rate_limit_403_is_retried():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(403, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={})
+
+    assert _run(handler, lambda gh: gh._get("/repos/o/r/pulls/1")).status_code == 200
+    assert len(calls) == 2
+
+
+def test_transport_error_is_retried():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ReadTimeout("timed out", request=request)
+        return httpx.Response(200, json={})
+
+    assert _run(handler, lambda gh: gh._get("/repos/o/r/pulls/1")).status_code == 200
+    assert len(calls) == 2
+
+
+def test_graphql_transport_error_falls_back_to_rest():
+    def handler(request):
+        if request.url.path == "/graphql":
+            raise httpx.ReadTimeout("timed out", request=request)
+        if request.url.path.endswith("/tags"):
+            return httpx.Response(200, json=[])
+        if request.url.path == "/search/issues":
+            return httpx.Response(200, json={"total_count": 1, "items": [{"number": 5}]})
+        return httpx.Response(200, json={"title": "PR 5", "labels": [], "user": {"login": "a"}})
+
+    async def call(gh):
+        gh.MAX_RETRIES = 0
+        return await gh.fetch_prs("o", "r", None, "HEAD", "2024-01-01")
+
+    assert [p.number for p in _run(handler, call)] == [5]
+
+
+def test_rest_pagination_bounds_pages_in_flight():
+    pages = 8
+    in_flight = {"now": 0, "max": 0}
+
+    async def handler(request):
+        if request.url.path == "/search/issues":
+            page = int(request.url.params["page"])
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            start = (page - 1) * 100
+            items = [{"number": n} for n in range(start + 1, start + 101)]
+            return httpx.Response(200, json={"total_count": pages * 100, "items": items})
+        # Slow hydration lets the producer run as far ahead as it is allowed to
+        await asyncio.sleep(0.001)
+        number = int(request.url.path.rsplit("/", 1)[1])
+        return httpx.Response(200, json={"title": f"PR {number}", "labels": [], "user": {"login": "a"}})
+
+    prs = _run(handler, lambda gh: gh._fetch_prs_rest("o", "r", None))
+    assert [p.number for p in prs] == list(range(1, pages * 100 + 1))
+    assert in_flight["max"] <= AsyncGitHubFetcher.MAX_PAGES_IN_FLIGHT
+
+
+def test_labels_normalized_once():
+    pr = _pr_from_json(1, {"title": "t", "labels": [{"name": "Type:Feat"}, {"name": "Breaking"}]})
+    assert pr.labels == ["type:feat", "breaking"]
+    assert pr.labels_norm == {"type:feat", "breaking"}
+
+
+def test_sync_wrapper_delegates_to_async_fetcher(monkeypatch):
+    async def fetch_prs(self, owner, name, since_ref, until_ref, since_date):
+        return [_pr_from_json(7, {"title": f"{owner}/{name} {since_ref}..{until_ref}"})]
+
+    monkeypatch.setattr(AsyncGitHubFetcher, "fetch_prs", fetch_prs)
+    prs = GitHubFetcher("token").fetch_prs("acme", "app", "v1", "v2", None)
+    assert [(p.number, p.title) for p in prs] == [(7, "acme/app v1..v2")]
+
+
+def _gql_node(number):
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "body": "",
+        "url": f"https://github.com/o/r/pull/{number}",
+        "mergedAt": "2024-01-02T00:00:00Z",
+        "changedFiles": 1,
+        "labels": {"nodes": [{"name": "Bug"}]},
+        "author": {"login": "a"},
+        "mergeCommit": {"oid": "abc"},
+    }
+
+
+def _gql_page(numbers, cursor=None):
+    page_info = {"endCursor": cursor, "hasNextPage": cursor is not None}
+    return {"data": {"search": {"pageInfo": page_info, "nodes": [_gql_node(n) for n in numbers]}}}
+
+
+def test_parse_graphql_search_errors_raise():
+    with pytest.raises(GraphQLError, match="bad query"):
+        _parse_graphql_search({"errors": [{"message": "bad query"}]})
+
+
+def test_parse_graphql_search_skips_non_pr_nodes():
+    page = _gql_page([1, 2])
+    page["data"]["search"]["nodes"][1:1] = [{}, None]
+    prs, cursor = _parse_graphql_search(page)
+    assert [p.number for p in prs] == [1, 2]
+    assert prs[0].labels == ["bug"] and prs[0].merge_sha == "abc"
+    assert cursor is None
+
+
+def test_parse_graphql_search_cursor_follows_has_next_page():
+    assert _parse_graphql_search(_gql_page([1], cursor="c1"))[1] == "c1"
+    page = _gql_page([1])
+    page["data"]["search"]["pageInfo"]["endCursor"] = "c1"
+    assert _parse_graphql_search(page)[1] is None
+
+
+def test_graphql_pages_until_no_next_page():
+    cursors = []
+
+    def handler(request):
+        cursor = json.loads(request.content)["variables"]["cursor"]
+        cursors.append(cursor)
+        return httpx.Response(200, json=_gql_page([1, 2], "c1") if cursor is None else _gql_page([3]))
+
+    prs = _run(handler, lambda gh: gh.fetch_prs_graphql("o", "r", None))
+    assert [p.number for p in prs] == [1, 2, 3]
+    assert cursors == [None, "c1"]
+
+
+def test_graphql_error_falls_back_to_rest():
+    paths = []
+
+    def handler(request):
+        paths.append(request.url.path)
+        if request.url.path == "/graphql":
+            return httpx.Response(200, json={"errors": [{"message": "Something went wrong"}]})
+        if request.url.path.endswith("/tags"):
+            return httpx.Response(200, json=[])
+        if request.url.path == "/search/issues":
+            return httpx.Response(200, json={"total_count": 1, "items": [{"number": 5}]})
+        return httpx.Response(200, json={"title": "PR 5", "labels": [], "user": {"login": "a"}})
+
+    prs = _run(handler, lambda gh: gh.fetch_prs("o", "r", None, "HEAD", "2024-01-01"))
+    assert [p.number for p in prs] == [5]
+    assert paths.count("/graphql") == 1 and "/repos/o/r/pulls/5" in paths
@@ -0,0 +1,104 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from openai import RateLimitError
+
+from release_notes_builder.llm_consolidator import (
+    DEFAULT_RATE_LIMIT_DELAY,
+    MAX_RATE_LIMIT_DELAY,
+    _llm_cache_file,
+    _parse_reset,
+    _rate_limit_delay,
+    _TokenBucket,
+)
+
+
+def _rate_limit_error(headers):
+    response = httpx.Response(429, request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions"), headers=headers)
+    return RateLimitError("rate limited", response=response, body=None)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("2", 2.0), ("0.5", 0.5), ("1s", 1.0), ("6m0s", 360.0), ("20ms", 0.02), ("1h2m", 3720.0)],
+)
+def test_parse_reset(value, expected):
+    assert _parse_reset(value) == pytest.approx(expected)
+
+
+def test_parse_reset_unparseable():
+    assert _parse_reset("") is None
+    assert _parse_reset(None) is None
+    assert _parse_reset("soon") is None
+
+
+def test_rate_limit_delay_prefers_retry_after():
+    e = _rate_limit_error({"retry-after": "3", "x-ratelimit-remaining-tokens": "0", "x-ratelimit-reset-tokens": "10s"})
+    assert _rate_limit_delay(e) == 3.0
+
+
+def test_rate_limit_delay_uses_exhausted_limit_reset():
+    e = _rate_limit_error({
+        "x-ratelimit-remaining-requests": "42",
+        "x-ratelimit-reset-requests": "20s",
+        "x-ratelimit-remaining-tokens": "0",
+        "x-ratelimit-reset-tokens": "1.5s",
+    })
+    assert _rate_limit_delay(e) == 1.5
+
+
+def test_rate_limit_delay_default_and_cap():
+    assert _rate_limit_delay(_rate_limit_error({})) == DEFAULT_RATE_LIMIT_DELAY
+    e = _rate_limit_error({"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "6m0s"})
+    assert _rate_limit_delay(e) == MAX_RATE_LIMIT_DELAY
+
+
+def test_token_bucket_counts_completion_tokens():
+    bucket = _TokenBucket(rpm=1000, tpm=10_000, completion_tokens=1000)
+    asyncio.run(bucket.acquire(500))
+    assert bucket._tokens == pytest.approx(8500, abs=5)
+
+
+def test_token_bucket_waits_for_token_refill():
+    # 6000 tpm refills 100 tokens/s, so 20 more tokens after draining the bucket take ~0.2s
+    bucket = _TokenBucket(rpm=1000, tpm=6000)
+
+    async def go():
+        await bucket.acquire(6000)
+        start = time.monotonic()
+        await bucket.acquire(20)
+        return time.monotonic() - start
+
+    assert 0.15 <= asyncio.run(go()) < 1.0
+
+
+def test_token_bucket_pause_holds_callers():
+    bucket = _TokenBucket(rpm=1000, tpm=100_000)
+
+    async def go():
+        bucket.pause(0.2)
+        start = time.monotonic()
+        await bucket.acquire(10)
+        return time.monotonic() - start
+
+    assert asyncio.run(go()) >= 0.2
+
+
+def test_llm_cache_key_covers_request(isolated_cache):
+    base = _llm_cache_file("gpt-4o", 0.2, "system", "user")
+    assert base == _llm_cache_file("gpt-4o", 0.2, "system", "user")
+    assert base.parent == isolated_cache / "llm"
+    variants = {
+        _llm_cache_file("gpt-4o-mini", 0.2, "system", "user"),
+        _llm_cache_file("gpt-4o", 0.7, "system", "user"),
+        _llm_cache_file("gpt-4o", 0.2, "other system", "user"),
+        _llm_cache_file("gpt-4o", 0.2, "system", "other user"),
+    }
+    assert base not in variants and len(variants) == 4
+
+
+def test_llm_cache_off(monkeypatch):
+    monkeypatch.setenv("RLSNOTES_CACHE_DIR", "off")
+    assert _llm_cache_file("gpt-4o", 0.2, "system", "user") is None
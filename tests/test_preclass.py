@@ -0,0 +1,29 @@
+from release_notes_builder.github_fetcher import PR
+from release_notes_builder.preclass import classify, split_trivial
+
+
+def _pr(number, title, labels=(), body=""):
+    return PR(
+        number=number,
+        title=title,
+        body_excerpt=body,
+        labels=list(labels),
+        author="dev",
+        url=f"https://github.com/acme/app/pull/{number}",
+        merge_sha=None,
+        merged_at=None,
+    )
+
+
+def test_split_trivial():
+    prs = [
+        _pr(1, "feat: add export button"),
+        _pr(2, "chore(deps): bump lodash"),
+        _pr(3, "ci: cache node_modules"),
+        _pr(4, "Update react", labels=["Dependencies"]),
+        _pr(5, "fix: handle empty cart"),
+        _pr(6, "build!: drop node 16", labels=["breaking"]),
+    ]
+    needs_llm, trivial = split_trivial([classify(p) for p in prs])
+    assert [c.pr.number for c in needs_llm] == [1, 5, 6]
+    assert [c.pr.number for c in trivial] == [2, 3, 4]
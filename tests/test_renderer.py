@@ -0,0 +1,28 @@
+from release_notes_builder.renderer import _product_for_repo, render_md
+
+
+def test_product_for_repo():
+    assert _product_for_repo("maple-labs/ya-webapp") == "Syrup"
+    assert _product_for_repo("maple-labs/syrup-ui") == "Syrup"
+    assert _product_for_repo("maple-labs/hq") == "hq"
+    # prefix match on the repo name is long-standing behaviour
+    assert _product_for_repo("maple-labs/hq-tools") == "hq"
+    assert _product_for_repo("maple-labs/maple-api") == "API"
+    assert _product_for_repo("maple-labs/docs") == "maple-labs/docs"
+
+
+def test_render_groups_bullets_by_product():
+    doc = {
+        "title": "Release",
+        "tldr": ["Faster exports"],
+        "repos": [
+            {"name": "o/api", "sections": [{"title": "Features", "items": [{"text": "Export", "prs": [1, 2]}]}]},
+            {"name": "o/other-api", "sections": [{"title": "Misc", "items": [{"text": "Tidy", "prs": []}]}]},
+        ],
+        "upgrade_notes": [],
+        "chores": [{"repo": "o/hq", "number": 3, "title": "chore: bump", "url": "https://github.com/o/hq/pull/3"}],
+    }
+    md = render_md(doc)
+    assert "**API**\n- :sparkles: Export [PR #1](https://github.com/o/api/pull/1) [PR #2](https://github.com/o/api/pull/2)\n- Tidy\n" in md
+    assert "<summary>Chores (1)</summary>" in md
+    assert "- **hq** chore: bump [PR #3](https://github.com/o/hq/pull/3)" in md
@@ -0,0 +1,116 @@
+import asyncio
+
+import httpx
+
+from release_notes_builder.shortcut_fetcher import SHORTCUT_API, AsyncShortcutFetcher, ShortcutFetcher
+
+
+class FakeResponse:
+    def __init__(self, status_code, data):
+        self.status_code = status_code
+        self._data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._data
+
+
+def _story(sid):
+    return {"id": sid, "name": f"Story {sid}", "app_url": f"https://app.shortcut.com/x/story/{sid}"}
+
+
+def _fetcher():
+    sc = ShortcutFetcher("token")
+    calls = []
+
+    def get(url, timeout=None):
+        calls.append(url)
+        sid = int(url.rsplit("/", 1)[1])
+        if sid >= 900:
+            return FakeResponse(404, None)
+        return FakeResponse(200, _story(sid))
+
+    sc.session.get = get
+    return sc, calls
+
+
+def test_get_stories_looks_up_each_id_once():
+    sc, calls = _fetcher()
+    stories = sc.get_stories([3, 1, 2, 1, 3])
+    assert sorted(stories) == [1, 2, 3]
+    assert sorted(calls) == [f"{SHORTCUT_API}/stories/{sid}" for sid in (1, 2, 3)]
+
+
+def test_missing_stories_are_skipped_and_remembered():
+    sc, calls = _fetcher()
+    assert sorted(sc.get_stories([1, 901])) == [1]
+    calls.clear()
+    assert sorted(sc.get_stories([901, 1])) == [1]
+    assert calls == []
+
+
+def test_cached_stories_make_no_requests():
+    sc, calls = _fetcher()
+    sc.get_stories([1, 2])
+    calls.clear()
+    # A fresh fetcher still hits the on-disk cache
+    sc2, calls2 = _fetcher()
+    assert sorted(sc.get_stories([2, 1])) == [1, 2]
+    assert sorted(sc2.get_stories([2, 1])) == [1, 2]
+    assert calls == [] and calls2 == []
+
+
+def _run_async(handler, call):
+    async def go():
+        async with AsyncShortcutFetcher("token") as sc:
+            await sc._client.aclose()
+            sc._client = httpx.AsyncClient(base_url=SHORTCUT_API, transport=httpx.MockTransport(handler))
+            return await call(sc)
+
+    return asyncio.run(go())
+
+
+def test_async_get_story_retries_rate_limit():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, json=_story(7))
+
+    story = _run_async(handler, lambda sc: sc.get_story(7))
+    assert story.id == 7
+    assert len(calls) == 2
+
+
+def test_async_get_story_memoizes_404():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(404)
+
+    async def call(sc):
+        return await sc.get_story(9), await sc.get_story(9)
+
+    assert _run_async(handler, call) == (None, None)
+    assert len(calls) == 1
+
+
+def test_async_concurrent_lookups_share_one_request():
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url.path)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=_story(int(request.url.path.rsplit("/", 1)[1])))
+
+    async def call(sc):
+        return await asyncio.gather(sc.get_stories([1234, 5]), sc.get_stories([1234]))
+
+    first, second = _run_async(handler, call)
+    assert first[1234].id == second[1234].id == 1234
+    assert sorted(calls) == ["/api/v3/stories/1234", "/api/v3/stories/5"]
@@ -0,0 +1,29 @@
+import time
+
+from release_notes_builder.utils import GitHubRetry, gh_rate_limit_wait, make_gh_session
+
+
+def test_plain_403_is_not_rate_limited():
+    assert gh_rate_limit_wait(403, {}) is None
+    assert gh_rate_limit_wait(403, {"x-ratelimit-remaining": "12"}) is None
+    assert gh_rate_limit_wait(404, {"Retry-After": "3"}) is None
+
+
+def test_403_rate_limit_waits():
+    assert gh_rate_limit_wait(403, {"Retry-After": "3"}) == 3.0
+    reset = str(int(time.time()) + 10)
+    wait = gh_rate_limit_wait(403, {"x-ratelimit-remaining": "0", "x-ratelimit-reset": reset})
+    assert 0 < wait <= 10
+    far = str(int(time.time()) + 3600)
+    assert gh_rate_limit_wait(403, {"x-ratelimit-remaining": "0", "x-ratelimit-reset": far}) is None
+
+
+def test_session_retry_only_retries_403_with_retry_after():
+    session = make_gh_session("token")
+    retry = session.get_adapter("https://api.github.com").max_retries
+    assert isinstance(retry, GitHubRetry)
+    assert not retry.is_retry("GET", 403, has_retry_after=False)
+    assert retry.is_retry("GET", 403, has_retry_after=True)
+    assert retry.is_retry("GET", 502)
+    # Retry.new() must keep the subclass across increments
+    assert isinstance(retry.new(total=1), GitHubRetry)